@@ -1,19 +1,53 @@
 import sys
 import os
 import re
+import functools
+import queue
+import threading
+import time
 from datetime import datetime
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                           QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                           QComboBox, QCheckBox, QTableWidget, QTableWidgetItem,
-                           QHeaderView, QTextBrowser, QSplitter, QMessageBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                           QHBoxLayout, QPushButton, QLabel, QFileDialog,
+                           QComboBox, QCheckBox, QTableView, QAbstractItemView,
+                           QHeaderView, QPlainTextEdit, QSplitter, QMessageBox)
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QTimer,
+                          QSortFilterProxyModel)
 import json
 
+# orjson (C implementation) is several times faster than stdlib json for
+# the per-line loads and the details-pane dumps; fall back silently when
+# it is not installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the existing except clauses keep working.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data, indent=2):
+        # orjson only offers two-space indentation
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data, indent=2):
+        return json.dumps(data, indent=indent)
+
 # Constants
 MAX_RECENT_FILES = 10
 
+# Compiled once at import: parse_log_entry runs on every tailed line, and
+# re.match's per-call cache lookup is measurable on that hot path. The
+# timestamp group uses [^\]]* rather than a lazy .*? so that long lines
+# without a closing bracket fail fast instead of backtracking.
+_LOG_RE = re.compile(r'^\[([^\]]*)\] \w+\.(\w+): (.*)')
+
+# Cheap pre-filter used by the watcher: extracts only the level so lines
+# the active filters would discard never pay for the full JSON decode.
+_LEVEL_RE = re.compile(r'^\[[^\]]*\] \w+\.(\w+):')
+
 # Legacy path for backward compatibility with older versions
 LEGACY_RECENT_FILES_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), 'recent_files.json'
@@ -42,36 +76,63 @@ def get_config_path():
 
     return os.path.join(base_dir, 'laralog.config')
 
+@functools.lru_cache(maxsize=256)
+def _normalize_path(path):
+    """
+    Normalize a filesystem path for duplicate comparisons.
+
+    Why this function exists: Windows paths are case-insensitive and may
+    vary in separators. Normalization ensures we prevent duplicates even if
+    the same path is represented with different case or slashes. The result
+    is memoized because the same handful of recent-file paths is
+    re-normalized every time the list is edited.
+    """
+    try:
+        return os.path.normcase(os.path.normpath(path))
+    except Exception:
+        return path
+
 class LogEntry:
+    # One instance per log line, retained for the whole session: slots cut
+    # the per-instance dict and make attribute loads in the model's data()
+    # hot path a fixed-offset read
+    __slots__ = ('timestamp', 'level', 'level_display', 'message', 'details')
+
     def __init__(self, timestamp, level, message, details=None):
         self.timestamp = timestamp
         self.level = level
+        # Cased once here so the model's data() can return a held string
+        # instead of allocating a fresh one on every paint of a Type cell
+        self.level_display = level.upper()
         self.message = message
         self.details = details or ""
         
     @staticmethod
-    def parse_log_entry(log_line):
+    def parse_log_entry(log_line, _match=_LOG_RE.match):
         try:
             # Extract timestamp and level using regex
-            match = re.match(r'\[(.*?)\] \w+\.(\w+): (.*)', log_line)
+            match = _match(log_line)
             if match:
                 timestamp, level, rest = match.groups()
                 
                 # Try to parse the JSON content
                 try:
-                    data = json.loads(rest)
+                    data = _json_loads(rest)
                     # Extract the main error message (first line of exception)
                     exception_text = data.get('exception', '')
                     if exception_text:
-                        # Split by newline and get first line for message
-                        message = exception_text.split('\n')[0].strip()
+                        # Only the first line is needed for the message;
+                        # partition avoids building the full split list
+                        message = exception_text.partition('\n')[0].strip()
                         # Keep the full exception text as details
                         details = exception_text
                     else:
                         # If no exception, use the entire rest as message
                         message = rest
-                        # Look for other JSON fields that might be useful
-                        details = json.dumps(data, indent=2)
+                        # Keep the raw JSON; show_details pretty-prints it
+                        # lazily on selection, so there is no point paying
+                        # for an indent-formatted dump on every line
+                        details = rest
                 except json.JSONDecodeError:
                     # If not JSON, use the text as is
                     message = rest
@@ -82,40 +143,239 @@ class LogEntry:
             print(f"Error parsing log entry: {e}")
             return None
 
-class LogWatcher(QThread):
-    log_updated = pyqtSignal(object)
-    
+class LogTableModel(QAbstractTableModel):
+    """
+    Table model backed by a plain list of LogEntry objects.
+
+    Why this class exists: Inserting rows into a QTableWidget allocates three
+    QTableWidgetItem objects per entry and triggers layout work on every
+    insert, which gets slow for large Laravel logs. A QAbstractTableModel
+    holds the entries directly and only supplies cell text when the view
+    actually paints it.
+    """
+
+    HEADERS = ['Time', 'Type', 'Message']
+
+    # Cap on retained entries: long tailing sessions otherwise grow the
+    # list (and paint cost) without bound. Oldest rows are evicted first.
+    MAX_ENTRIES = 50000
+
+    # Computed once; flags() is called per visible cell on every paint and
+    # selection change, so it must not branch or rebuild the flag mask
+    _FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self._entries = entries
+
+    def flags(self, index):
+        return self._FLAGS
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            entry = self._entries[index.row()]
+            column = index.column()
+            if column == 0:
+                return entry.timestamp
+            if column == 1:
+                return entry.level_display
+            if column == 2:
+                return entry.message
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def append_entry(self, entry):
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self.endInsertRows()
+        self._trim_overflow()
+
+    def extend_entries(self, entries):
+        if not entries:
+            return
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+        self._trim_overflow()
+
+    def _trim_overflow(self):
+        # A deque(maxlen=...) would evict silently, desyncing the view;
+        # the model has to announce removals, so trim the list explicitly
+        overflow = len(self._entries) - self.MAX_ENTRIES
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self._entries[:overflow]
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
+
+class LevelFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters log rows by level on top of LogTableModel.
+
+    Why this class exists: Hiding rows with setRowHidden costs an O(N)
+    Python loop on the GUI thread every time a checkbox toggles or a batch
+    arrives. A proxy model answers filterAcceptsRow per row from Qt's C++
+    side and only re-queries what is visible when the filter changes.
+    """
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self._entries = entries
+        self._active = frozenset()
+
+    def set_active_levels(self, levels):
+        self._active = frozenset(levels)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._entries[source_row].level in self._active
+
+class LogWatcher:
+    """
+    Tails the log file on a daemon thread and hands parsed batches to the
+    GUI through a queue.Queue.
+
+    Why this class is not a QThread: every pyqtSignal emit marshals its
+    arguments through QMetaObject, which adds up on a busy log. A plain
+    reader thread plus a GUI-side QTimer that drains the queue in batches
+    keeps the hot path free of Qt machinery entirely.
+    """
+
+    # Coalesce parsed entries into batches: the GUI drains whole batches,
+    # so a smaller batch just means more queue traffic, not lower latency.
+    BATCH_SIZE = 64
+    POLL_INTERVAL = 0.1  # seconds to sleep when no new data arrived
+
     def __init__(self, file_path):
-        super().__init__()
-        self.file_path = file_path
+        self.file_path = os.path.abspath(file_path)
         self.active = True
         self.last_position = 0
         self.filters = []
-    
+        self._filter_set = frozenset()
+        self.batches = queue.Queue()
+        self._thread = None
+        self._fh = None
+        # Tail of the last chunk when it ended mid-line; prepended to the
+        # next chunk so a line split across two writes parses intact
+        self._pending = ''
+
     def set_filters(self, filters):
         self.filters = filters
-    
+        self._filter_set = frozenset(level.lower() for level in filters)
+
     def should_display_log(self, level):
         if not self.filters:
             return True
-        return level.lower() in self.filters
-    
-    def run(self):
+        return level.lower() in self._filter_set
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.active = False
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+
+    def _run(self):
         while self.active:
-            if os.path.exists(self.file_path):
-                with open(self.file_path, 'r', encoding='utf-8') as file:
-                    file.seek(self.last_position)
-                    while self.active:
-                        line = file.readline()
-                        if line:
-                            entry = LogEntry.parse_log_entry(line.strip())
-                            if entry and self.should_display_log(entry.level):
-                                self.log_updated.emit(entry)
-                            self.last_position = file.tell()
-                        else:
-                            self.msleep(100)
-            else:
-                self.msleep(1000)
+            if not self.read_new_entries():
+                time.sleep(self.POLL_INTERVAL)
+
+    def _reopen(self):
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+        try:
+            self._fh = open(self.file_path, 'r', encoding='utf-8')
+        except OSError:
+            return False
+        self.last_position = 0
+        self._pending = ''
+        return True
+
+    def read_new_entries(self):
+        """Consume newly appended data; returns True if any was read."""
+        if not self.active:
+            return False
+        if self._fh is None and not self._reopen():
+            # File does not exist (yet); retried on the next poll
+            return False
+        # fstat on the open handle avoids a path lookup per tick
+        try:
+            size = os.fstat(self._fh.fileno()).st_size
+        except OSError:
+            self._fh.close()
+            self._fh = None
+            return False
+        if size < self.last_position:
+            # Truncated in place (log rotation / "Empty Log"); rewind and
+            # re-read from the top
+            if not self._reopen():
+                return False
+        elif size == self.last_position:
+            # No growth on our handle -- but the path may now point at a
+            # replacement file (rotation swaps the inode), so check it
+            try:
+                if os.path.getsize(self.file_path) == size:
+                    return False
+            except OSError:
+                return False
+            if not self._reopen():
+                return False
+
+        # Slurp everything available in one read and split in C, rather
+        # than paying a readline + tell round trip per line
+        file = self._fh
+        file.seek(self.last_position)
+        chunk = file.read()
+        self.last_position = file.tell()
+        if not chunk:
+            return False
+        if self._pending:
+            chunk = self._pending + chunk
+            self._pending = ''
+        if not chunk.endswith('\n'):
+            # Hold back the unterminated tail until the rest arrives
+            chunk, _, self._pending = chunk.rpartition('\n')
+            if not chunk:
+                return True
+        buf = []
+        for line in chunk.splitlines():
+            # Pre-filter on the level alone: when the user watches only
+            # error/critical, most lines never need the regex-capture +
+            # JSON decode below
+            level_match = _LEVEL_RE.match(line)
+            if level_match and self.should_display_log(level_match.group(1)):
+                entry = LogEntry.parse_log_entry(line.strip())
+                if entry:
+                    buf.append(entry)
+            if len(buf) >= self.BATCH_SIZE:
+                self.batches.put(buf[:])
+                buf.clear()
+        if buf:
+            self.batches.put(buf)
+        return True
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -123,9 +383,26 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Laravel Log Watcher")
         self.setMinimumSize(1200, 800)
         
+        # Recent-files writes are debounced: rapid file picks mark the list
+        # dirty and the actual json.dump happens once the timer fires (or
+        # on close), instead of hitting the disk per change
+        self._recent_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self._flush_recent_files)
+
+        # Drains the watcher's queue in batches while watching; polling a
+        # queue.Queue every 16 ms is far cheaper than per-batch Qt signal
+        # marshalling from the reader thread
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(16)
+        self._drain_timer.timeout.connect(self._drain_log_queue)
+
         # Load recent files
         self.recent_files = self.load_recent_files()
-        # Persist any cleanup (e.g., deduplication, migration) immediately
+        # Persist any cleanup (e.g., deduplication, migration) on the
+        # debounced schedule
         self.save_recent_files()
         
         # Main widget and layout
@@ -177,26 +454,37 @@ class MainWindow(QMainWindow):
             checkbox.stateChanged.connect(self.update_filters)
             self.filter_checks[level] = checkbox
             filter_layout.addWidget(checkbox)
-        
+
+        # Cached on checkbox changes so per-entry filtering is an O(1) set
+        # lookup instead of re-reading every checkbox per row
+        self._active_filters = frozenset(self.log_levels)
+
         layout.addLayout(filter_layout)
         
         # Create splitter for table and details
         splitter = QSplitter(Qt.Vertical)
         
         # Log table
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(3)
-        self.log_table.setHorizontalHeaderLabels(['Time', 'Type', 'Message'])
+        self.log_entries = []
+        self.log_model = LogTableModel(self.log_entries, self)
+        self.log_proxy = LevelFilterProxyModel(self.log_entries, self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_proxy.set_active_levels(self._active_filters)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_proxy)
         self.log_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.log_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.log_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.log_table.verticalHeader().setVisible(False)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.log_table.itemSelectionChanged.connect(self.show_details)
+        self.log_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.log_table.selectionModel().selectionChanged.connect(self.show_details)
         splitter.addWidget(self.log_table)
         
-        # Details view
-        self.details_view = QTextBrowser()
+        # Details view: QPlainTextEdit skips QTextBrowser's rich-text
+        # pipeline, which we never used -- show_details only sets plain text
+        self.details_view = QPlainTextEdit()
+        self.details_view.setReadOnly(True)
+        self.details_view.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.details_view.setMinimumHeight(200)
         splitter.addWidget(self.details_view)
         
@@ -220,7 +508,6 @@ class MainWindow(QMainWindow):
         self.watcher = None
         self.current_file = None
         self.watching = False
-        self.log_entries = []
     
     def load_recent_files(self):
         config_path = get_config_path()
@@ -260,29 +547,49 @@ class MainWindow(QMainWindow):
         return []
 
     def save_recent_files(self):
-        config_path = get_config_path()
+        # Callers keep the list deduped and trimmed (load_recent_files and
+        # add_recent_file both enforce it), so just schedule the deferred
+        # disk write instead of re-normalizing every path again
+        self._recent_dirty = True
+        self._save_timer.start()
+
+    def _flush_recent_files(self):
+        if not self._recent_dirty:
+            return
         try:
-            # Always save a cleaned, trimmed list
-            cleaned = self._dedupe_and_trim(self.recent_files)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(cleaned, f)
-            self.recent_files = cleaned
+            with open(get_config_path(), 'w', encoding='utf-8') as f:
+                json.dump(self.recent_files, f)
+            self._recent_dirty = False
         except Exception as e:
             print(f"Error saving recent files: {e}")
 
     def add_recent_file(self, file_path):
-        # Remove any existing entries that match this path (case-insensitive on Windows)
-        target_key = self._normalize_path(file_path)
-        self.recent_files = [p for p in self.recent_files if self._normalize_path(p) != target_key]
-        # Insert at the top and persist
-        self.recent_files.insert(0, file_path)
-        self.recent_files = self._dedupe_and_trim(self.recent_files)
+        # One pass: drop existing entries for this path (case-insensitive
+        # on Windows), promote it to the top, and trim to the cap -- the
+        # old code deduped three times over for the same result
+        target_key = _normalize_path(file_path)
+        self.recent_files = [file_path] + [
+            p for p in self.recent_files if _normalize_path(p) != target_key]
+        del self.recent_files[MAX_RECENT_FILES:]
         self.save_recent_files()
         
-        # Update combo box
-        self.recent_files_combo.clear()
-        self.recent_files_combo.addItem("Recent Files")
-        self.recent_files_combo.addItems(self.recent_files)
+        # Sync the combo box in place: clear()+addItems would reset the
+        # whole view and re-fire currentIndexChanged mid-rebuild, calling
+        # recent_file_selected spuriously. Item 0 stays the header row.
+        combo = self.recent_files_combo
+        combo.blockSignals(True)
+        try:
+            for i, path in enumerate(self.recent_files, start=1):
+                if i < combo.count():
+                    if combo.itemText(i) != path:
+                        combo.setItemText(i, path)
+                else:
+                    combo.addItem(path)
+            while combo.count() > len(self.recent_files) + 1:
+                combo.removeItem(combo.count() - 1)
+            combo.setCurrentIndex(0)
+        finally:
+            combo.blockSignals(False)
 
     def recent_file_selected(self, index):
         if index > 0 and self.recent_files_combo.currentText() != "Recent Files":
@@ -292,24 +599,11 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "Warning", f"File not found:\n{file_path}")
                 # Remove all duplicates of this path and persist
-                target_key = self._normalize_path(file_path)
-                self.recent_files = [p for p in self.recent_files if self._normalize_path(p) != target_key]
+                target_key = _normalize_path(file_path)
+                self.recent_files = [p for p in self.recent_files if _normalize_path(p) != target_key]
                 self.save_recent_files()
                 self.recent_files_combo.removeItem(index)
 
-    def _normalize_path(self, path):
-        """
-        Normalize a filesystem path for duplicate comparisons.
-
-        Why this function exists: Windows paths are case-insensitive and may
-        vary in separators. Normalization ensures we prevent duplicates even if
-        the same path is represented with different case or slashes.
-        """
-        try:
-            return os.path.normcase(os.path.normpath(path))
-        except Exception:
-            return path
-
     def _dedupe_and_trim(self, files):
         """
         Remove duplicate paths (case-insensitive on Windows) while preserving
@@ -323,7 +617,7 @@ class MainWindow(QMainWindow):
         for p in files or []:
             if not p:
                 continue
-            key = self._normalize_path(p)
+            key = _normalize_path(p)
             if key in seen:
                 continue
             seen.add(key)
@@ -353,16 +647,15 @@ class MainWindow(QMainWindow):
             self.set_current_file(file_path)
     
     def update_filters(self):
-        active_filters = [level for level, checkbox in self.filter_checks.items()
-                         if checkbox.isChecked()]
-        
+        self._active_filters = frozenset(
+            level for level, checkbox in self.filter_checks.items()
+            if checkbox.isChecked())
+
         if self.watcher:
-            self.watcher.set_filters(active_filters)
-        
-        # Update visible rows
-        for row in range(self.log_table.rowCount()):
-            level = self.log_table.item(row, 1).text().lower()
-            self.log_table.setRowHidden(row, level not in active_filters)
+            self.watcher.set_filters(self._active_filters)
+
+        # One C++-side invalidation updates all visible rows
+        self.log_proxy.set_active_levels(self._active_filters)
     
     def toggle_watching(self):
         if not self.watching:
@@ -373,45 +666,52 @@ class MainWindow(QMainWindow):
     def start_watching(self):
         if self.current_file:
             self.watcher = LogWatcher(self.current_file)
-            self.watcher.log_updated.connect(self.add_log_entry)
             self.update_filters()
             self.watcher.start()
+            self._drain_timer.start()
             self.watching = True
             self.watch_btn.setText("Stop Watching")
-    
+
     def stop_watching(self):
+        self._drain_timer.stop()
         if self.watcher:
-            self.watcher.active = False
-            self.watcher.wait()
+            self.watcher.stop()
+            # Flush anything the reader queued before it stopped
+            self._drain_log_queue()
             self.watcher = None
         self.watching = False
         self.watch_btn.setText("Start Watching")
+
+    def _drain_log_queue(self):
+        if not self.watcher:
+            return
+        batch = []
+        try:
+            while True:
+                batch.extend(self.watcher.batches.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self.add_log_entries(batch)
     
-    def add_log_entry(self, entry):
-        row = self.log_table.rowCount()
-        self.log_table.insertRow(row)
-        
-        # Add items
-        self.log_table.setItem(row, 0, QTableWidgetItem(entry.timestamp))
-        self.log_table.setItem(row, 1, QTableWidgetItem(entry.level.upper()))
-        self.log_table.setItem(row, 2, QTableWidgetItem(entry.message))
-        
-        # Store the full entry for details view
-        self.log_entries.append(entry)
-        
-        # Scroll to the new row
+    def add_log_entries(self, entries):
+        if not entries:
+            return
+        # The proxy filters the new rows by level as they are inserted
+        self.log_model.extend_entries(entries)
+
+        # Scroll once per batch, not per row
         self.log_table.scrollToBottom()
-        
-        # Apply current filters
-        level = entry.level.lower()
-        active_filters = [level for level, checkbox in self.filter_checks.items()
-                         if checkbox.isChecked()]
-        self.log_table.setRowHidden(row, level not in active_filters)
-    
+
+    def add_log_entry(self, entry):
+        # Kept for callers that still deliver one entry at a time
+        self.add_log_entries([entry])
+
     def show_details(self):
-        selected_rows = self.log_table.selectedItems()
+        selected_rows = self.log_table.selectionModel().selectedRows()
         if selected_rows:
-            row = selected_rows[0].row()
+            # Selection indexes belong to the proxy; map back to the source
+            row = self.log_proxy.mapToSource(selected_rows[0]).row()
             entry = self.log_entries[row]
             if entry.details:
                 # Format the details with proper line breaks and spacing
@@ -419,8 +719,8 @@ class MainWindow(QMainWindow):
                 if isinstance(formatted_details, str):
                     try:
                         # Try to parse and re-format JSON
-                        data = json.loads(formatted_details)
-                        formatted_details = json.dumps(data, indent=4)
+                        data = _json_loads(formatted_details)
+                        formatted_details = _json_dumps(data, indent=4)
                     except json.JSONDecodeError:
                         # If not JSON, preserve line breaks
                         formatted_details = formatted_details.replace('\\n', '\n')
@@ -429,8 +729,7 @@ class MainWindow(QMainWindow):
                 self.details_view.setPlainText("No additional details available")
     
     def clear_display(self):
-        self.log_table.setRowCount(0)
-        self.log_entries.clear()
+        self.log_model.clear()
         self.details_view.clear()
     
     def empty_log_file(self):
@@ -470,6 +769,7 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         self.stop_watching()
+        self._flush_recent_files()
         event.accept()
 
 if __name__ == '__main__':